@@ -23,7 +23,7 @@ from .well_utils import extract_well, normalize_well, canonicalize_well, strip_w
 from .validation import QueryRequest, WellNameRequest, FormationRequest, validate_query
 from .thresholds import MatchingThresholds, RetrievalThresholds, get_matching_thresholds, get_retrieval_thresholds
 from .tool_adapter import result_to_string, tool_wrapper
-from .cache import Cache, get_llm_cache, get_embedding_cache, cached, generate_cache_key
+from .cache import Cache, LRUCache, get_llm_cache, get_embedding_cache, cached, generate_cache_key
 from .security import RateLimiter, TokenBucket, get_rate_limiter, rate_limit, sanitize_input
 
 # Initialize logging on import (but only if not already configured)
@@ -78,6 +78,7 @@ __all__ = [
     "result_to_string",
     "tool_wrapper",
     "Cache",
+    "LRUCache",
     "get_llm_cache",
     "get_embedding_cache",
     "cached",
@@ -5,10 +5,12 @@ This module provides a flexible caching system with TTL support, key generation,
 and cache invalidation strategies. Designed to work seamlessly with Streamlit.
 """
 import hashlib
+import heapq
 import json
 import time
 import threading
-from typing import Any, Callable, Dict, Optional, TypeVar, Union
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, List, Optional, Set, TypeVar, Union
 from functools import wraps
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -57,6 +59,12 @@ class Cache:
             max_size: Maximum number of entries (None for unlimited)
         """
         self._store: Dict[str, CacheEntry] = {}
+        # Keys grouped by whole-second expiry, plus a min-heap of bucket times,
+        # so cleanup only visits buckets that are due. A bucket stays in the
+        # dict (even once emptied) until it is drained, so each time is queued
+        # exactly once and the heap never outgrows the dict.
+        self._by_expiry: Dict[int, Set[str]] = {}
+        self._expiry_heap: List[int] = []
         self._default_ttl = default_ttl
         self._max_size = max_size
         self._lock = threading.Lock()  # Thread-safe lock for all operations
@@ -79,6 +87,7 @@ class Cache:
             if entry.is_expired():
                 # Remove expired entry
                 del self._store[key]
+                self._unindex(key, entry)
                 return None
             
             entry.touch()
@@ -94,6 +103,12 @@ class Cache:
             ttl: Time-to-live in seconds (uses default if None)
         """
         with self._lock:
+            now = time.time()
+            heap = self._expiry_heap
+            if heap and heap[0] + 1 <= now:
+                # Nothing else may call cleanup_expired; keep the index bounded
+                self._drain_expired(now)
+            
             # Check if we need to evict entries due to size limit
             if self._max_size is not None and key not in self._store:
                 # If adding a new entry would exceed max_size, evict least recently used
@@ -103,11 +118,53 @@ class Cache:
             if ttl is None:
                 ttl = self._default_ttl
             
-            expires_at = time.time() + ttl
+            previous = self._store.get(key)
+            if previous is not None:
+                self._unindex(key, previous)
+            
+            expires_at = now + ttl
             self._store[key] = CacheEntry(
                 value=value,
                 expires_at=expires_at
             )
+            bucket_time = int(expires_at)
+            bucket = self._by_expiry.get(bucket_time)
+            if bucket is None:
+                # New buckets are rare (one per second of writes at a given TTL)
+                bucket = self._by_expiry[bucket_time] = set()
+                heapq.heappush(heap, bucket_time)
+            bucket.add(key)
+    
+    def _unindex(self, key: str, entry: CacheEntry) -> None:
+        """
+        Drop key from its expiry bucket (called with lock held).
+        
+        Args:
+            key: Cache key
+            entry: Entry currently stored under key
+        """
+        bucket = self._by_expiry.get(int(entry.expires_at))
+        if bucket is not None:
+            # Empty buckets are kept until drained so their time isn't re-queued
+            bucket.discard(key)
+    
+    def _drain_expired(self, now: float) -> int:
+        """
+        Drop every bucket whose whole second has passed (called with lock held).
+        
+        Args:
+            now: Current time
+            
+        Returns:
+            Number of entries removed
+        """
+        heap = self._expiry_heap
+        removed = 0
+        while heap and heap[0] + 1 <= now:
+            for key in self._by_expiry.pop(heapq.heappop(heap)):
+                del self._store[key]
+                removed += 1
+        return removed
     
     def _evict_lru(self) -> None:
         """
@@ -123,34 +180,47 @@ class Cache:
             self._store.keys(),
             key=lambda k: self._store[k].last_accessed
         )
-        del self._store[lru_key]
+        self._unindex(lru_key, self._store.pop(lru_key))
         logger.debug(f"Evicted LRU entry: {lru_key}")
     
     def delete(self, key: str) -> None:
         """Delete entry from cache (thread-safe)."""
         with self._lock:
-            self._store.pop(key, None)
+            entry = self._store.pop(key, None)
+            if entry is not None:
+                self._unindex(key, entry)
     
     def clear(self) -> None:
         """Clear all entries from cache (thread-safe)."""
         with self._lock:
             self._store.clear()
+            self._by_expiry.clear()
+            self._expiry_heap.clear()
     
     def cleanup_expired(self) -> int:
         """
         Remove all expired entries (thread-safe).
         
+        Bucket times are popped from a min-heap while they are due, so the
+        cost is proportional to the due buckets and their keys; live entries
+        and future buckets are never visited.
+        
         Returns:
             Number of entries removed
         """
         with self._lock:
-            expired_keys = [
-                key for key, entry in self._store.items()
-                if entry.is_expired()
-            ]
-            for key in expired_keys:
-                del self._store[key]
-            return len(expired_keys)
+            now = time.time()
+            removed = self._drain_expired(now)
+            heap = self._expiry_heap
+            if heap and heap[0] <= now:
+                # The current second's bucket can still hold unexpired keys
+                bucket = self._by_expiry[heap[0]]
+                expired_keys = [key for key in bucket if self._store[key].is_expired()]
+                for key in expired_keys:
+                    del self._store[key]
+                    bucket.discard(key)
+                removed += len(expired_keys)
+            return removed
     
     def stats(self) -> Dict[str, Any]:
         """
@@ -172,6 +242,68 @@ class Cache:
             }
 
 
+
+class LRUCache(Generic[T]):
+    """
+    Thread-safe bounded mapping that evicts the least recently used entry.
+    
+    Unlike Cache there is no TTL or per-entry bookkeeping: a hit is one
+    dict lookup plus move_to_end, and eviction is O(1). Callers compute
+    misses outside the lock, so two threads may both compute a missing
+    value; the later set() wins.
+    """
+    
+    def __init__(self, max_size: int):
+        """
+        Initialize LRU cache.
+        
+        Args:
+            max_size: Maximum number of entries
+        """
+        self._store: "OrderedDict[Hashable, T]" = OrderedDict()
+        self._max_size = max_size
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[T]:
+        """
+        Get value and mark it most recently used (thread-safe).
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value or None if not found
+        """
+        with self._lock:
+            value = self._store.get(key)
+            if value is not None:
+                self._store.move_to_end(key)
+            return value
+    
+    def set(self, key: Hashable, value: T) -> None:
+        """
+        Store value, evicting the least recently used entry if full (thread-safe).
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        with self._lock:
+            if key in self._store:
+                self._store.move_to_end(key)
+            elif len(self._store) >= self._max_size:
+                self._store.popitem(last=False)
+            self._store[key] = value
+    
+    def clear(self) -> None:
+        """Clear all entries from cache (thread-safe)."""
+        with self._lock:
+            self._store.clear()
+    
+    def __len__(self) -> int:
+        return len(self._store)
+
+
 # Global cache instances
 _llm_cache: Optional[Cache] = None
 _embedding_cache: Optional[Cache] = None
@@ -9,7 +9,6 @@ import re
 from typing import TypeVar, Generic, Optional, Callable, Union, Any
 from dataclasses import dataclass
 from enum import Enum
-import re
 
 T = TypeVar('T')
 U = TypeVar('U')
@@ -29,6 +28,32 @@ class ErrorType(Enum):
     LLM_ERROR = "llm_error"
 
 
+# (pattern, replacement) pairs applied in order by sanitize_error_message.
+# Order matters: later rules see the output of earlier ones.
+_SANITIZE_RULES = [
+    # Absolute file paths (Windows and Unix): C:\path\to\file or /path/to/file
+    (re.compile(r'[A-Z]:\\[^\s]+'), '[FILE_PATH]'),
+    (re.compile(r'/[^\s]+'), '[FILE_PATH]'),
+    # Relative paths with ../
+    (re.compile(r'\.\./[^\s]+'), '[FILE_PATH]'),
+    (re.compile(r'\.\\[^\s]+'), '[FILE_PATH]'),
+    # API keys and secrets (OpenAI keys are typically 20+ chars after sk-)
+    (re.compile(r'sk-[a-zA-Z0-9]{10,}'), '[API_KEY]'),
+    (re.compile(r'api[_-]?key\s*[:=]\s*[^\s]+', re.IGNORECASE), 'api_key=[REDACTED]'),
+    (re.compile(r'password\s*[:=]\s*[^\s]+', re.IGNORECASE), 'password=[REDACTED]'),
+    (re.compile(r'secret\s*[:=]\s*[^\s]+', re.IGNORECASE), 'secret=[REDACTED]'),
+    (re.compile(r'token\s*[:=]\s*[^\s]+', re.IGNORECASE), 'token=[REDACTED]'),
+    # Email addresses (may contain sensitive info)
+    (re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'), '[EMAIL]'),
+    # Stack trace indicators
+    (re.compile(r'Traceback \(most recent call last\):.*', re.DOTALL), '[STACK_TRACE]'),
+    (re.compile(r'File "[^"]+", line \d+.*'), '[STACK_TRACE]'),
+    # Common internal paths
+    (re.compile(r'C:\\Users\\[^\\]+'), '[USER_HOME]'),
+    (re.compile(r'/home/[^/]+'), '[USER_HOME]'),
+]
+
+
 def sanitize_error_message(message: Optional[str]) -> str:
     """
     Sanitize error message to remove sensitive information.
@@ -51,34 +76,8 @@ def sanitize_error_message(message: Optional[str]) -> str:
         return message
     
     sanitized = message
-    
-    # Remove absolute file paths (Windows and Unix)
-    # Pattern: C:\path\to\file or /path/to/file
-    sanitized = re.sub(r'[A-Z]:\\[^\s]+', '[FILE_PATH]', sanitized)
-    sanitized = re.sub(r'/[^\s]+', '[FILE_PATH]', sanitized)
-    
-    # Remove relative paths with ../
-    sanitized = re.sub(r'\.\./[^\s]+', '[FILE_PATH]', sanitized)
-    sanitized = re.sub(r'\.\\[^\s]+', '[FILE_PATH]', sanitized)
-    
-    # Remove API keys and secrets (common patterns)
-    # Pattern: sk-... (OpenAI keys are typically 20+ chars after sk-)
-    sanitized = re.sub(r'sk-[a-zA-Z0-9]{10,}', '[API_KEY]', sanitized)
-    sanitized = re.sub(r'api[_-]?key\s*[:=]\s*[^\s]+', 'api_key=[REDACTED]', sanitized, flags=re.IGNORECASE)
-    sanitized = re.sub(r'password\s*[:=]\s*[^\s]+', 'password=[REDACTED]', sanitized, flags=re.IGNORECASE)
-    sanitized = re.sub(r'secret\s*[:=]\s*[^\s]+', 'secret=[REDACTED]', sanitized, flags=re.IGNORECASE)
-    sanitized = re.sub(r'token\s*[:=]\s*[^\s]+', 'token=[REDACTED]', sanitized, flags=re.IGNORECASE)
-    
-    # Remove email addresses (may contain sensitive info)
-    sanitized = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '[EMAIL]', sanitized)
-    
-    # Remove stack trace indicators
-    sanitized = re.sub(r'Traceback \(most recent call last\):.*', '[STACK_TRACE]', sanitized, flags=re.DOTALL)
-    sanitized = re.sub(r'File "[^"]+", line \d+.*', '[STACK_TRACE]', sanitized)
-    
-    # Remove common internal paths
-    sanitized = re.sub(r'C:\\Users\\[^\\]+', '[USER_HOME]', sanitized)
-    sanitized = re.sub(r'/home/[^/]+', '[USER_HOME]', sanitized)
+    for pattern, replacement in _SANITIZE_RULES:
+        sanitized = pattern.sub(replacement, sanitized)
     
     return sanitized
 
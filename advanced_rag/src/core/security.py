@@ -342,6 +342,13 @@ def rate_limit(identifier_func: Optional[Callable] = None):
     return decorator
 
 
+# Characters that cannot form any of the dangerous patterns checked below
+# (each of those needs '<', ':', '=' or '(') and are never control characters.
+_SAFE_INPUT_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 -/._?,"
+)
+
+
 def sanitize_input(text: str, max_length: int = 2000) -> Result[str, AppError]:
     """
     Enhanced input sanitization.
@@ -366,6 +373,10 @@ def sanitize_input(text: str, max_length: int = 2000) -> Result[str, AppError]:
             message=f"Input too long (max {max_length} characters)"
         ))
     
+    # Fast path: plain queries need no control-char stripping or pattern scan
+    if _SAFE_INPUT_CHARS.issuperset(text):
+        return Result.ok(text.strip())
+    
     # Remove null bytes and control characters
     sanitized = text.replace('\x00', '')
     sanitized = ''.join(
@@ -4,6 +4,7 @@ Adapter for converting Result types to string returns for LangChain tools.
 LangChain tools must return strings, but we want to use Result pattern
 internally. This adapter bridges the gap.
 """
+import json
 from typing import Callable, TypeVar
 from .result import Result, AppError, ErrorType
 
@@ -25,7 +26,9 @@ def result_to_string(result: Result[str, AppError], default_error: str = "An err
         String value or formatted error message (sanitized)
     """
     if result.is_ok():
-        return result.unwrap()
+        # Success path stays free of any serialization work
+        value = result.unwrap()
+        return value if isinstance(value, str) else str(value)
     else:
         error = result.error()
         # Use sanitized user-facing error information
@@ -33,8 +36,6 @@ def result_to_string(result: Result[str, AppError], default_error: str = "An err
         error_dict = error.to_user_dict()
         # Add "error" key for backward compatibility
         error_dict["error"] = error_dict["type"]
-        
-        import json
         return json.dumps(error_dict, ensure_ascii=False)
 
 
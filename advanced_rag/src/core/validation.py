@@ -14,6 +14,40 @@ MAX_QUERY_SIZE_BYTES: int = 10000  # ~10KB max query size
 MAX_WELL_SIZE_BYTES: int = 200  # ~200 bytes max well name size
 MAX_FORMATION_SIZE_BYTES: int = 500  # ~500 bytes max formation name size
 
+# str.translate deletion tables for control characters. Well and formation
+# names drop all of them; queries keep tab, newline and carriage return.
+_CONTROL_CHARS = dict.fromkeys(range(0x00, 0x20))
+_QUERY_CONTROL_CHARS = dict.fromkeys([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20)])
+
+# Potential injection patterns in queries, checked against the lowercased query
+_QUERY_DANGEROUS_PATTERNS = [
+    (r'<script', 'Script tags'),
+    (r'javascript:', 'JavaScript protocol'),
+    (r'onerror=', 'Event handlers'),
+    (r'onload=', 'Event handlers'),
+    (r'eval\(', 'Eval function'),
+    (r'exec\(', 'Exec function'),
+    (r'import\s+os', 'OS import'),
+    (r'__import__', 'Dynamic import'),
+    (r'subprocess', 'Subprocess execution'),
+    (r'shell\s*=', 'Shell assignment'),
+]
+# Single alternation for the common clean-query case; the list above is only
+# walked (in order) to name the pattern once something has matched.
+_QUERY_DANGEROUS_RE = re.compile("|".join(f"(?:{p})" for p, _ in _QUERY_DANGEROUS_PATTERNS))
+
+# Patterns rejected in well and formation names, checked against the lowercased name
+_NAME_DANGEROUS_PATTERNS = [
+    (r'<script', 'Script tags'),
+    (r'javascript:', 'JavaScript protocol'),
+    (r'\.\./', 'Path traversal'),
+    (r'\.\.\\', 'Path traversal'),
+]
+_NAME_DANGEROUS_RE = re.compile("|".join(f"(?:{p})" for p, _ in _NAME_DANGEROUS_PATTERNS))
+
+# Well names must carry at least one digit (e.g. 15/9-F-5)
+_DIGIT_RE = re.compile(r'\d')
+
 
 class QueryRequest(BaseModel):
     """
@@ -52,26 +86,14 @@ class QueryRequest(BaseModel):
             raise ValueError(f"Query too large: {query_bytes} bytes (max {MAX_QUERY_SIZE_BYTES} bytes)")
         
         # Remove null bytes and control characters (except newlines and tabs)
-        v = re.sub(r'[\x00-\x08\x0b-\x0c\x0e-\x1f]', '', v)
+        v = v.translate(_QUERY_CONTROL_CHARS)
         
         # Check for potential injection patterns (enhanced protection)
-        dangerous_patterns = [
-            (r'<script', 'Script tags'),
-            (r'javascript:', 'JavaScript protocol'),
-            (r'onerror=', 'Event handlers'),
-            (r'onload=', 'Event handlers'),
-            (r'eval\(', 'Eval function'),
-            (r'exec\(', 'Exec function'),
-            (r'import\s+os', 'OS import'),
-            (r'__import__', 'Dynamic import'),
-            (r'subprocess', 'Subprocess execution'),
-            (r'shell\s*=', 'Shell assignment'),
-        ]
-        
         query_lower = v.lower()
-        for pattern, description in dangerous_patterns:
-            if re.search(pattern, query_lower):
-                raise ValueError(f"Query contains potentially dangerous pattern: {description}")
+        if _QUERY_DANGEROUS_RE.search(query_lower):
+            for pattern, description in _QUERY_DANGEROUS_PATTERNS:
+                if re.search(pattern, query_lower):
+                    raise ValueError(f"Query contains potentially dangerous pattern: {description}")
         
         return v.strip()
     
@@ -107,24 +129,18 @@ class WellNameRequest(BaseModel):
             raise ValueError(f"Well name too large: {well_bytes} bytes (max {MAX_WELL_SIZE_BYTES} bytes)")
         
         # Remove null bytes and control characters
-        v = re.sub(r'[\x00-\x1f]', '', v)
+        v = v.translate(_CONTROL_CHARS)
         
         # Basic format check (should contain numbers)
-        if not re.search(r'\d', v):
+        if not _DIGIT_RE.search(v):
             raise ValueError("Well name must contain at least one digit")
         
         # Check for dangerous patterns
-        dangerous_patterns = [
-            (r'<script', 'Script tags'),
-            (r'javascript:', 'JavaScript protocol'),
-            (r'\.\./', 'Path traversal'),
-            (r'\.\.\\', 'Path traversal'),
-        ]
-        
         well_lower = v.lower()
-        for pattern, description in dangerous_patterns:
-            if re.search(pattern, well_lower):
-                raise ValueError(f"Well name contains potentially dangerous pattern: {description}")
+        if _NAME_DANGEROUS_RE.search(well_lower):
+            for pattern, description in _NAME_DANGEROUS_PATTERNS:
+                if re.search(pattern, well_lower):
+                    raise ValueError(f"Well name contains potentially dangerous pattern: {description}")
         
         return v.strip()
     
@@ -158,20 +174,14 @@ class FormationRequest(BaseModel):
             raise ValueError(f"Formation name too large: {formation_bytes} bytes (max {MAX_FORMATION_SIZE_BYTES} bytes)")
         
         # Remove null bytes and control characters
-        v = re.sub(r'[\x00-\x1f]', '', v)
+        v = v.translate(_CONTROL_CHARS)
         
         # Check for dangerous patterns
-        dangerous_patterns = [
-            (r'<script', 'Script tags'),
-            (r'javascript:', 'JavaScript protocol'),
-            (r'\.\./', 'Path traversal'),
-            (r'\.\.\\', 'Path traversal'),
-        ]
-        
         formation_lower = v.lower()
-        for pattern, description in dangerous_patterns:
-            if re.search(pattern, formation_lower):
-                raise ValueError(f"Formation name contains potentially dangerous pattern: {description}")
+        if _NAME_DANGEROUS_RE.search(formation_lower):
+            for pattern, description in _NAME_DANGEROUS_PATTERNS:
+                if re.search(pattern, formation_lower):
+                    raise ValueError(f"Formation name contains potentially dangerous pattern: {description}")
         
         return v.strip()
     
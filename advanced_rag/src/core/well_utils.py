@@ -5,9 +5,17 @@ This module provides consistent well name normalization and extraction
 across the entire codebase, eliminating duplicate implementations.
 """
 import re
+from functools import lru_cache
 from typing import Optional
 from ..normalize.query_normalizer import extract_well as _extract_well_base, _canonicalize_well
 
+# Compiled once at import; normalize_well sits on every cache lookup path.
+_NON_ALNUM_RE = re.compile(r"[^0-9A-Z]+")
+# Every ASCII byte except 0-9 and A-Z, deleted in one bytes.translate pass
+_NON_ALNUM_ASCII = bytes(
+    b for b in range(128) if not (0x30 <= b <= 0x39 or 0x41 <= b <= 0x5A)
+)
+
 
 def extract_well(text: str) -> Optional[str]:
     """
@@ -38,7 +46,15 @@ def normalize_well(well: str) -> str:
     Returns:
         Normalized well name (uppercase, alphanumeric only)
     """
-    return re.sub(r"[^0-9A-Z]+", "", well.upper())
+    upper = well.upper()
+    if upper.isascii():
+        return upper.encode("ascii").translate(None, _NON_ALNUM_ASCII).decode("ascii")
+    return _NON_ALNUM_RE.sub("", upper)
+
+
+# Candidate lists are the same handful of catalog wells on every fuzzy match,
+# so their normalized forms are memoized rather than recomputed per call.
+_normalize_well_cached = lru_cache(maxsize=4096)(normalize_well)
 
 
 def canonicalize_well(well: str) -> str:
@@ -98,8 +114,8 @@ def match_well_fuzzy(query_well: str, candidate_wells: list[str], threshold: flo
     """
     try:
         from rapidfuzz import process
-        normalized_query = normalize_well(query_well)
-        normalized_candidates = [normalize_well(w) for w in candidate_wells]
+        normalized_query = _normalize_well_cached(query_well)
+        normalized_candidates = [_normalize_well_cached(w) for w in candidate_wells]
         
         result = process.extractOne(
             normalized_query,
@@ -108,17 +124,13 @@ def match_well_fuzzy(query_well: str, candidate_wells: list[str], threshold: flo
         )
         
         if result:
-            # Find original well name
-            matched_normalized = result[0]
-            for orig, norm in zip(candidate_wells, normalized_candidates):
-                if norm == matched_normalized:
-                    return orig
+            # extractOne returns (match, score, index); map back to the original name
+            return candidate_wells[result[2]]
         return None
     except ImportError:
         # Fallback to exact match if rapidfuzz not available
-        normalized_query = normalize_well(query_well)
+        normalized_query = _normalize_well_cached(query_well)
         for candidate in candidate_wells:
-            if normalize_well(candidate) == normalized_query:
+            if _normalize_well_cached(candidate) == normalized_query:
                 return candidate
         return None
-
@@ -30,16 +30,31 @@ class NormalizedQuery:
     intent: str  # "fact" | "list" | "section" | "unknown"
 
 
+# Well-name patterns are compiled once; extract_well runs on every incoming query.
+_WELL_DASH_RE = re.compile(r"(\d+)-(\d+)")
+_WELL_PLATFORM_RE = re.compile(r"(\d+/\d+)([A-Z])(\d)")
+_WELL_LETTER_DIGIT_RE = re.compile(r"(\d+/\d+-[A-Z])(\d)")
+_WELL_PLATFORM_SEARCH_RE = re.compile(
+    r"(?:Well\s+NO\s+)?(\d+[\s_/-]*\d+[\s_/-]*[A-Z][\s_/-]*-?\s*\d+(?:\s+[A-Z0-9]+|[A-Z0-9]+)?)\b",
+    re.IGNORECASE,
+)
+_WELL_GENERIC_SEARCH_RE = re.compile(
+    r"(?:Well\s+NO\s+)?(\d+[\s_/-]*\d+[\s_/-]*-?\s*\d+(?:\s+[A-Z0-9]+|[A-Z0-9]+)?)\b",
+    re.IGNORECASE,
+)
+_LETTER_DIGITS_RE = re.compile(r"([A-Z])(\d+)", re.IGNORECASE)
+
+
 def _canonicalize_well(s: str) -> str:
     """Normalize well string for matching across formats. Supports any well format, not just 15/9."""
     w = s.strip().upper()
     w = w.replace("_", "/").replace(" ", "")
     # Normalize any XX-YY to XX/YY pattern
-    w = re.sub(r"(\d+)-(\d+)", r"\1/\2", w)
+    w = _WELL_DASH_RE.sub(r"\1/\2", w)
     # Normalize XX/YYF to XX/YY-F (platform wells)
-    w = re.sub(r"(\d+/\d+)([A-Z])(\d)", r"\1-\2-\3", w)
+    w = _WELL_PLATFORM_RE.sub(r"\1-\2-\3", w)
     # Ensure dash between letter and digits when missing: XX/YY-F5 -> XX/YY-F-5
-    w = re.sub(r"(\d+/\d+-[A-Z])(\d)", r"\1-\2", w)
+    w = _WELL_LETTER_DIGIT_RE.sub(r"\1-\2", w)
     # Handle common 15/9 patterns (backward compatibility)
     w = w.replace("15-9", "15/9")
     w = w.replace("15/9F", "15/9-F")
@@ -57,15 +72,15 @@ def extract_well(text: str) -> Optional[str]:
     # Generic pattern: match any well format like "XX/YY-ZZZ" or "XX/YY-ABC-ZZZ"
     # Pattern 1: Platform format (XX/YY-F-NN or XX/YY-FNN or XX/YY-F-NN A)
     # Handle both "F-5" and "F5" formats
-    m = re.search(r"(?:Well\s+NO\s+)?(\d+[\s_/-]*\d+[\s_/-]*[A-Z][\s_/-]*-?\s*\d+(?:\s+[A-Z0-9]+|[A-Z0-9]+)?)\b", text, re.IGNORECASE)
+    m = _WELL_PLATFORM_SEARCH_RE.search(text)
     if m:
         well = m.group(1)
         # Normalize F5 to F-5 format for consistency
-        well = re.sub(r'([A-Z])(\d+)', r'\1-\2', well, flags=re.IGNORECASE)
+        well = _LETTER_DIGITS_RE.sub(r'\1-\2', well)
         return _canonicalize_well(well)
     
     # Pattern 2: Non-platform format (XX/YY-NNN or XX/YY-NNN suffix)
-    m2 = re.search(r"(?:Well\s+NO\s+)?(\d+[\s_/-]*\d+[\s_/-]*-?\s*\d+(?:\s+[A-Z0-9]+|[A-Z0-9]+)?)\b", text, re.IGNORECASE)
+    m2 = _WELL_GENERIC_SEARCH_RE.search(text)
     if m2:
         return _canonicalize_well(m2.group(1))
     
@@ -19,9 +19,13 @@ from pydantic import BaseModel, Field
 from rank_bm25 import BM25Okapi
 from ..processors.intelligent_chunker import IntelligentChunker
 from .cross_encoder_reranker import rerank_documents
+from ..core.cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on memoized retrieve() results per RetrieverTool instance
+_RETRIEVE_CACHE_SIZE = 512
+
 
 class RetrieverTool:
     """Manages ChromaDB vector store and retriever for RAG."""
@@ -90,6 +94,10 @@ class RetrieverTool:
         self._mmr_enabled = os.getenv("RAG_MMR", "true").lower() in {"1", "true", "yes"}
         self._mmr_lambda = float(os.getenv("RAG_MMR_LAMBDA", "0.7"))
         self._embed_cache: Dict[str, List[float]] = {}
+
+        # Memoized retrieve() results keyed by (query, k); cleared whenever the index changes.
+        # Locked per operation: one RetrieverTool is shared by every session thread.
+        self._retrieve_cache: LRUCache[Tuple[Document, ...]] = LRUCache(_RETRIEVE_CACHE_SIZE)
         
         logger.info(f"[OK] RetrieverTool initialized with model: {embedding_model}")
         logger.info(f"[OK] Using IntelligentChunker: chunk_size={chunk_size}, overlap={chunk_overlap}")
@@ -209,6 +217,7 @@ class RetrieverTool:
         # Persist lexical store for BM25 hybrid retrieval
         self._persist_lexical_store(splits)
         self._load_lexical_store()  # build bm25 in-memory for this process
+        self._retrieve_cache.clear()
         
         logger.info(f"[OK] Vector store built with {len(splits)} chunks")
     
@@ -239,6 +248,7 @@ class RetrieverTool:
             if not self._load_lexical_store():
                 self._bootstrap_lexical_store_from_chroma()
                 self._load_lexical_store()
+            self._retrieve_cache.clear()
             
             logger.info("[OK] Vector store loaded successfully")
             return True
@@ -654,6 +664,37 @@ class RetrieverTool:
 
         docs = self._llm_rerank(query, docs, top_n=k_final)
         return docs[:k_final]
+
+    def retrieve(self, query: str, k: int = 10) -> Tuple[Document, ...]:
+        """
+        Run expanded hybrid retrieval for a query.
+        
+        Results are memoized per (query, k) in a bounded LRU until the index
+        is rebuilt or reloaded, so repeated questions skip embedding, BM25
+        and reranking.
+        
+        Args:
+            query: User query
+            k: Number of documents to return
+            
+        Returns:
+            Tuple of retrieved documents (shared with the cache; do not mutate)
+        """
+        if self.retriever is None:
+            raise RuntimeError("Retriever not initialized. Call build_vectorstore() or load_vectorstore() first.")
+        
+        key = (query, k)
+        cached = self._retrieve_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        expanded = self._expand_query(query)
+        if len(expanded) > 1:
+            logger.info(f"[RETRIEVE] Query expanded into {len(expanded)} variants")
+        # Computed outside the cache lock so slow retrievals don't serialize sessions
+        docs = tuple(self._hybrid_retrieve(expanded, k_vec=24, k_lex=40, k_final=k))
+        self._retrieve_cache.set(key, docs)
+        return docs
     
     def _normalize_well_name(self, well_name: str) -> str:
         """Normalize well name to handle different formats (15/9-19A = 15_9-19A = 15-9-19A)."""
@@ -1294,10 +1335,7 @@ class RetrieverTool:
                 and any(k in query_lower for k in ["each", "every", "all", "complete", "entire"])
             )
             if not is_big_well_picks_list and self._bm25 is not None:
-                expanded = self._expand_query(query)
-                if len(expanded) > 1:
-                    logger.info(f"[RETRIEVE] Query expanded into {len(expanded)} variants")
-                hybrid_docs = self._hybrid_retrieve(expanded, k_vec=24, k_lex=40, k_final=10)
+                hybrid_docs = self.retrieve(query, k=10)
                 if hybrid_docs:
                     logger.info(f"[RETRIEVE] Hybrid returning {len(hybrid_docs)} chunks")
                     # Phase 1.5: Include source and page information
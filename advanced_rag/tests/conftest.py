@@ -8,10 +8,43 @@ from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch
 import os
 import sys
+from hypothesis import settings, HealthCheck, Phase
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# Hypothesis profiles: "ci" (default) keeps property tests fast, with no
+# example database or shrinking; "thorough" and "symbolic" are for nightly runs.
+# Select with HYPOTHESIS_PROFILE=<name>.
+settings.register_profile(
+    "ci",
+    max_examples=25,
+    database=None,
+    deadline=None,
+    phases=(Phase.explicit, Phase.generate),
+    suppress_health_check=[HealthCheck.too_slow],
+)
+settings.register_profile(
+    "thorough",
+    max_examples=500,
+    deadline=None,
+)
+# "symbolic" swaps random generation for CrossHair's symbolic execution, which
+# reaches rare branches with fewer examples. Hypothesis rejects unknown
+# backends at registration, so it is only available with hypothesis-crosshair.
+try:
+    import hypothesis_crosshair_provider  # noqa: F401
+except ImportError:
+    pass
+else:
+    settings.register_profile(
+        "symbolic",
+        backend="crosshair",
+        max_examples=30,
+        deadline=None,
+    )
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "ci"))
+
 
 @pytest.fixture
 def temp_vectorstore(tmp_path):
@@ -5,7 +5,7 @@ Tests cache effectiveness, hit rates, and performance improvements.
 """
 import pytest
 import time
-from src.core.cache import get_llm_cache, Cache
+from src.core.cache import Cache
 
 
 @pytest.mark.performance
@@ -13,40 +13,34 @@ from src.core.cache import get_llm_cache, Cache
 class TestCachePerformance:
     """Performance tests for caching."""
     
-    def test_cache_hit_performance(self, mock_config):
-        """Test that cache hits are faster than misses."""
-        cache = get_llm_cache()
-        
-        # Set a value
+    @pytest.fixture
+    def cache(self):
+        """
+        Fresh in-memory cache for each test.
+        
+        Keeps timing runs independent of entries left in the process-wide
+        LLM cache singleton by other tests.
+        """
+        return Cache(default_ttl=3600)
+    
+    @pytest.mark.benchmark(group="cache_get")
+    def test_cache_hit_performance(self, benchmark, cache):
+        """Benchmark cache lookups for a present key."""
         cache.set("perf_test", "value", ttl=60)
         
-        # Time cache hit
-        start = time.perf_counter()
-        for _ in range(1000):  # More iterations for better timing
-            cache.get("perf_test")
-        hit_time = time.perf_counter() - start
+        result = benchmark(cache.get, "perf_test")
         
-        # Time cache miss
-        start = time.perf_counter()
-        for _ in range(1000):  # More iterations for better timing
-            cache.get("nonexistent_key")
-        miss_time = time.perf_counter() - start
-        
-        # Cache hits should be faster (or at least not much slower)
-        # For very fast operations, both might be near-zero, so just verify they complete
-        assert hit_time >= 0, f"Cache hit time invalid: {hit_time:.6f}s"
-        assert miss_time >= 0, f"Cache miss time invalid: {miss_time:.6f}s"
-        
-        # Both operations should complete quickly
-        # Cache hits may sometimes be slightly slower due to overhead, but should be reasonable
-        # The important thing is that both complete in reasonable time
-        assert hit_time < 0.1, f"Cache hit too slow: {hit_time:.6f}s"
-        assert miss_time < 0.1, f"Cache miss too slow: {miss_time:.6f}s"
+        assert result == "value"
     
-    def test_cache_throughput(self, mock_config):
-        """Test cache can handle high throughput."""
-        cache = get_llm_cache()
+    @pytest.mark.benchmark(group="cache_get")
+    def test_cache_miss_performance(self, benchmark, cache):
+        """Benchmark cache lookups for a missing key."""
+        result = benchmark(cache.get, "nonexistent_key")
         
+        assert result is None
+    
+    def test_cache_throughput(self, cache):
+        """Test cache can handle high throughput."""
         # Set many values
         start = time.time()
         for i in range(1000):
@@ -63,10 +57,8 @@ class TestCachePerformance:
         assert set_time < 1.0, f"Cache set too slow: {set_time:.4f}s"
         assert get_time < 1.0, f"Cache get too slow: {get_time:.4f}s"
     
-    def test_cache_memory_efficiency(self, mock_config):
+    def test_cache_memory_efficiency(self, cache):
         """Test cache doesn't leak memory."""
-        cache = get_llm_cache()
-        
         # Add many entries
         for i in range(100):
             cache.set(f"key_{i}", "x" * 1000, ttl=1)  # Short TTL
@@ -87,10 +79,9 @@ class TestCachePerformance:
         assert final_stats["active_entries"] < initial_stats["total_entries"], \
             "Cache didn't clean up expired entries"
     
-    def test_cache_concurrent_access(self, mock_config):
+    def test_cache_concurrent_access(self, cache):
         """Test cache handles concurrent access correctly."""
         import threading
-        cache = get_llm_cache()
         
         # Set initial values
         for i in range(10):
@@ -143,10 +134,8 @@ class TestCachePerformance:
         assert stats["active_entries"] <= 100, \
             f"Cache exceeded max_size: {stats['active_entries']}"
     
-    def test_cache_latency_percentiles(self, mock_config):
+    def test_cache_latency_percentiles(self, cache):
         """Test cache operation latency percentiles."""
-        cache = get_llm_cache()
-        
         # Set up test data
         for i in range(100):
             cache.set(f"key_{i}", f"value_{i}", ttl=60)
@@ -3,89 +3,82 @@ Property-based tests for query expansion and normalization.
 
 Tests properties like consistency, reversibility, and edge cases.
 """
+import functools
+
 import pytest
-from hypothesis import given, strategies as st, assume, settings
-from src.normalize.query_normalizer import normalize_query
+from hypothesis import given, strategies as st
+from src.normalize.query_normalizer import NormalizedQuery, normalize_query
+
+# Queries are words, well names and common punctuation; a restricted alphabet
+# keeps Hypothesis from sampling and shrinking across the full Unicode range.
+QUERY_TEXT = st.text(
+    alphabet=st.characters(categories=("Lu", "Ll", "Nd"), include_characters=" /-_?.,'()"),
+    min_size=1,
+    max_size=200,
+)
+# Blank queries are rejected while drawing rather than via assume() in each test
+NONBLANK_QUERY_TEXT = QUERY_TEXT.filter(lambda q: bool(q.strip()))
+
+
+EXPECTED_FIELDS = {"raw", "well", "formation", "property", "tool", "intent"}
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_normalize(query):
+    """normalize_query is pure in its text argument, so replayed/shrunk examples can share results."""
+    return normalize_query(query)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _clear_normalize_cache():
+    """Bound the shim's memory to this module's run."""
+    yield
+    _cached_normalize.cache_clear()
 
 
 @pytest.mark.property
 class TestQueryExpansionProperties:
     """Property-based tests for query expansion."""
     
-    @given(st.text(min_size=1, max_size=200))  # Reduced max_size to avoid timeout
-    @settings(deadline=5000)  # Increase deadline for potentially slow operations
+    def test_normalized_query_declares_expected_fields(self):
+        """NormalizedQuery's shape is static, so check its fields once rather than per example."""
+        assert EXPECTED_FIELDS <= NormalizedQuery.__dataclass_fields__.keys()
+    
+    @given(NONBLANK_QUERY_TEXT)
     def test_normalize_query_returns_object(self, query):
         """normalize_query should always return a NormalizedQuery object."""
-        assume(query.strip())  # Skip empty queries
-        
-        try:
-            normalized = normalize_query(query)
-            assert normalized is not None, \
-                f"normalize_query returned None for: {query}"
-            assert hasattr(normalized, "well"), \
-                f"NormalizedQuery missing 'well' attribute"
-            assert hasattr(normalized, "formation"), \
-                f"NormalizedQuery missing 'formation' attribute"
-        except Exception as e:
-            # Some queries might fail, but should fail gracefully
-            assert isinstance(e, (ValueError, TypeError, AttributeError)), \
-                f"Unexpected exception type: {type(e)}"
+        normalized = _cached_normalize(query)
+        assert isinstance(normalized, NormalizedQuery), \
+            f"normalize_query returned {type(normalized)} for: {query}"
     
-    @given(st.text(min_size=1, max_size=200))
-    @settings(deadline=5000)  # Increase deadline for potentially slow operations
+    @given(st.from_regex(r"[\w!@#$%^&*()]{1,200}", fullmatch=True))
     def test_normalize_handles_special_chars(self, query):
         """normalize_query should handle special characters."""
-        # Add some special chars
-        special_query = f"{query}!@#$%^&*()"
-        
-        try:
-            normalized = normalize_query(special_query)
-            assert normalized is not None
-        except Exception:
-            # Some special chars might cause issues, that's ok
-            pass
+        normalized = _cached_normalize(query)
+        assert normalized is not None
     
-    @given(st.text(min_size=1, max_size=200))
-    @settings(deadline=5000, max_examples=20)  # Limit examples and increase deadline
+    @given(NONBLANK_QUERY_TEXT)
     def test_normalize_query_consistency(self, query):
         """normalize_query should return consistent results for same input."""
-        assume(query.strip())
+        # Compare a (possibly cached) result against a fresh call so the
+        # check still exercises determinism rather than the cache
+        normalized1 = _cached_normalize(query)
+        normalized2 = normalize_query(query)
         
-        try:
-            normalized1 = normalize_query(query)
-            normalized2 = normalize_query(query)
-            
-            # Results should be consistent
-            assert normalized1.well == normalized2.well, \
-                f"Well extraction inconsistent: {normalized1.well} vs {normalized2.well}"
-            assert normalized1.formation == normalized2.formation, \
-                f"Formation extraction inconsistent: {normalized1.formation} vs {normalized2.formation}"
-        except Exception:
-            # Some queries might fail, that's ok
-            pass
+        # Results should be consistent
+        assert normalized1.well == normalized2.well, \
+            f"Well extraction inconsistent: {normalized1.well} vs {normalized2.well}"
+        assert normalized1.formation == normalized2.formation, \
+            f"Formation extraction inconsistent: {normalized1.formation} vs {normalized2.formation}"
     
-    @given(st.text(min_size=1, max_size=100))
-    @settings(deadline=5000, max_examples=20)
+    @given(NONBLANK_QUERY_TEXT)
     def test_normalize_query_attributes(self, query):
         """NormalizedQuery should have all required attributes."""
-        assume(query.strip())
+        normalized = _cached_normalize(query)
+        assert isinstance(normalized, NormalizedQuery)
         
-        try:
-            normalized = normalize_query(query)
-            # Check all required attributes exist
-            assert hasattr(normalized, "raw")
-            assert hasattr(normalized, "well")
-            assert hasattr(normalized, "formation")
-            assert hasattr(normalized, "property")
-            assert hasattr(normalized, "tool")
-            assert hasattr(normalized, "intent")
-            
-            # Check types
-            assert isinstance(normalized.raw, str)
-            assert normalized.well is None or isinstance(normalized.well, str)
-            assert normalized.formation is None or isinstance(normalized.formation, str)
-            assert normalized.intent in ["fact", "list", "section", "unknown"]
-        except Exception:
-            # Some queries might fail, that's ok
-            pass
-
+        # Check types
+        assert isinstance(normalized.raw, str)
+        assert normalized.well is None or isinstance(normalized.well, str)
+        assert normalized.formation is None or isinstance(normalized.formation, str)
+        assert normalized.intent in ["fact", "list", "section", "unknown"]
@@ -1,9 +1,10 @@
 """
 Unit tests for cache module.
 """
+import threading
 import pytest
 import time
-from src.core.cache import Cache, CacheEntry, generate_cache_key, cached, get_llm_cache, get_embedding_cache
+from src.core.cache import Cache, CacheEntry, LRUCache, generate_cache_key, cached, get_llm_cache, get_embedding_cache
 
 
 @pytest.mark.unit
@@ -116,6 +117,138 @@ class TestCache:
         assert removed >= 1
         assert cache.get("key1") is None
         assert cache.get("key2") == "value2"  # Should still be valid
+    
+    def test_cleanup_expired_respects_overwritten_ttl(self):
+        """Test cleanup_expired skips keys re-set with a longer TTL."""
+        cache = Cache()
+        cache.set("key1", "old", ttl=0.01)
+        cache.set("key1", "new", ttl=3600)  # Moves key1 to a later expiry bucket
+        cache.set("key2", "value2", ttl=0.01)
+        cache.delete("key2")
+        
+        time.sleep(0.02)
+        assert cache.cleanup_expired() == 0
+        assert cache.get("key1") == "new"
+
+    def test_cleanup_expired_after_bucket_recreated(self):
+        """Test cleanup_expired handles buckets emptied and re-filled before expiry."""
+        cache = Cache()
+        cache.set("key1", "value1", ttl=0.01)
+        cache.delete("key1")  # Empties the bucket, leaving its time queued
+        cache.set("key1", "value1", ttl=0.01)
+        cache.set("key2", "value2", ttl=3600)
+
+        time.sleep(1.1)  # Let the whole expiry second pass
+        assert cache.cleanup_expired() == 1
+        assert cache.cleanup_expired() == 0
+        assert cache.get("key2") == "value2"
+        assert cache.stats()["total_entries"] == 1
+
+    @pytest.mark.parametrize("delete_between", [False, True], ids=["overwrite", "set_delete"])
+    def test_expiry_index_stays_bounded_under_rewrites(self, delete_between):
+        """Test rewriting one key doesn't grow the expiry heap."""
+        cache = Cache(default_ttl=3600)
+        for i in range(10_000):
+            cache.set("key1", i)
+            if delete_between:
+                cache.delete("key1")
+
+        # One entry per distinct expiry second (a loop may straddle a second)
+        assert len(cache._expiry_heap) <= 2
+        assert len(cache._by_expiry) == len(cache._expiry_heap)
+
+    def test_set_drains_elapsed_buckets(self):
+        """Test set() prunes expired entries without cleanup_expired being called."""
+        cache = Cache()
+        for i in range(100):
+            cache.set(f"key{i}", i, ttl=0.01)
+
+        time.sleep(1.1)  # Let the whole expiry second pass
+        cache.set("fresh", "value", ttl=3600)
+        assert cache.stats()["total_entries"] == 1
+        assert len(cache._expiry_heap) == 1
+        assert cache.get("fresh") == "value"
+
+
+@pytest.mark.unit
+class TestLRUCache:
+    """Test LRUCache class."""
+    
+    def test_get_returns_none_for_missing_key(self):
+        """Test get returns None for non-existent key."""
+        assert LRUCache(2).get("missing") is None
+    
+    def test_evicts_least_recently_used(self):
+        """Test a hit refreshes an entry so the oldest unused one is evicted."""
+        cache = LRUCache(2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # "a" becomes most recently used
+        cache.set("c", 3)  # Full: evicts "b", not "a"
+        
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+    
+    def test_overwrite_does_not_evict(self):
+        """Test re-setting an existing key replaces it without evicting others."""
+        cache = LRUCache(2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 10)  # Also refreshes "a"
+        cache.set("c", 3)
+        
+        assert cache.get("a") == 10
+        assert cache.get("b") is None
+        assert len(cache) == 2
+    
+    def test_clear(self):
+        """Test clear removes all entries."""
+        cache = LRUCache(2)
+        cache.set("a", 1)
+        cache.clear()
+        assert cache.get("a") is None
+        assert len(cache) == 0
+    
+    def test_concurrent_get_and_set(self):
+        """Test hits racing with evictions in other threads don't raise."""
+        
+        class YieldingKey:
+            """Key whose hashing releases the GIL, opening a window mid-operation."""
+            def __init__(self, value: int):
+                self.value = value
+            
+            def __hash__(self) -> int:
+                time.sleep(0)
+                return hash(self.value)
+            
+            def __eq__(self, other: object) -> bool:
+                return isinstance(other, YieldingKey) and self.value == other.value
+        
+        keys = [YieldingKey(i) for i in range(5)]
+        cache = LRUCache(2)
+        barrier = threading.Barrier(8)
+        errors = []
+        
+        def worker(offset: int) -> None:
+            barrier.wait()
+            try:
+                for i in range(500):
+                    key = keys[(offset + i) % len(keys)]
+                    if cache.get(key) is None:
+                        cache.set(key, i + 1)
+            except Exception as e:  # pragma: no cover - only on regression
+                errors.append(e)
+        
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert errors == []
+        assert len(cache) <= 2
 
 
 @pytest.mark.unit
@@ -5,72 +5,104 @@ import pytest
 from src.core.result import Result, AppError, ErrorType, sanitize_error_message
 
 
+@pytest.fixture(scope="module")
+def ok42():
+    """Successful Result holding 42 (Result and AppError are immutable, so sharing is safe)."""
+    return Result.ok(42)
+
+
+@pytest.fixture(scope="module")
+def ok5():
+    """Successful Result holding 5."""
+    return Result.ok(5)
+
+
+@pytest.fixture(scope="module")
+def validation_error():
+    """Validation AppError."""
+    return AppError(ErrorType.VALIDATION_ERROR, "Invalid input")
+
+
+@pytest.fixture(scope="module")
+def not_found_error():
+    """Not-found AppError."""
+    return AppError(ErrorType.NOT_FOUND_ERROR, "Not found")
+
+
+@pytest.fixture(scope="module")
+def processing_error():
+    """Processing AppError."""
+    return AppError(ErrorType.PROCESSING_ERROR, "Error")
+
+
+@pytest.fixture(scope="module")
+def equality_results(validation_error):
+    """Results compared pairwise by TestResult.test_equality."""
+    return [
+        Result.ok(42),
+        Result.ok(42),
+        Result.ok(100),
+        Result.err(validation_error),
+    ]
+
+
 @pytest.mark.unit
 class TestResult:
     """Test Result monad operations."""
     
-    def test_ok_creates_success_result(self):
+    def test_ok_creates_success_result(self, ok42):
         """Test Result.ok() creates successful result."""
-        result = Result.ok(42)
-        assert result.is_ok()
-        assert not result.is_err()
-        assert result.unwrap() == 42
+        assert ok42.is_ok()
+        assert not ok42.is_err()
+        assert ok42.unwrap() == 42
     
-    def test_err_creates_error_result(self):
+    def test_err_creates_error_result(self, validation_error):
         """Test Result.err() creates error result."""
-        error = AppError(ErrorType.VALIDATION_ERROR, "Invalid input")
-        result = Result.err(error)
+        result = Result.err(validation_error)
         assert result.is_err()
         assert not result.is_ok()
-        assert result.error() == error
+        assert result.error() == validation_error
     
-    def test_unwrap_or_returns_default_on_error(self):
+    def test_unwrap_or_returns_default_on_error(self, not_found_error):
         """Test unwrap_or() returns default for errors."""
-        error = AppError(ErrorType.NOT_FOUND_ERROR, "Not found")
-        result = Result.err(error)
+        result = Result.err(not_found_error)
         assert result.unwrap_or(100) == 100
     
-    def test_unwrap_or_returns_value_on_success(self):
+    def test_unwrap_or_returns_value_on_success(self, ok42):
         """Test unwrap_or() returns value for success."""
-        result = Result.ok(42)
-        assert result.unwrap_or(100) == 42
+        assert ok42.unwrap_or(100) == 42
     
-    def test_map_applies_function_to_value(self):
+    def test_map_applies_function_to_value(self, ok5):
         """Test map() applies function to successful value."""
-        result = Result.ok(5)
-        mapped = result.map(lambda x: x * 2)
+        mapped = ok5.map(lambda x: x * 2)
         assert mapped.is_ok()
         assert mapped.unwrap() == 10
     
-    def test_map_preserves_error(self):
+    def test_map_preserves_error(self, processing_error):
         """Test map() preserves error."""
-        error = AppError(ErrorType.PROCESSING_ERROR, "Error")
-        result = Result.err(error)
+        result = Result.err(processing_error)
         mapped = result.map(lambda x: x * 2)
         assert mapped.is_err()
-        assert mapped.error() == error
+        assert mapped.error() == processing_error
     
-    def test_map_handles_exceptions(self):
+    def test_map_handles_exceptions(self, ok5):
         """Test map() converts exceptions to errors."""
-        result = Result.ok(5)
-        mapped = result.map(lambda x: x / 0)  # Will raise ZeroDivisionError
+        mapped = ok5.map(lambda x: x / 0)  # Will raise ZeroDivisionError
         assert mapped.is_err()
         assert mapped.error().type == ErrorType.PROCESSING_ERROR
     
-    def test_and_then_chains_operations(self):
+    def test_and_then_chains_operations(self, ok5):
         """Test and_then() chains Result-returning functions."""
-        result = Result.ok(5)
-        chained = result.and_then(lambda x: Result.ok(x * 2))
+        chained = ok5.and_then(lambda x: Result.ok(x * 2))
         assert chained.is_ok()
         assert chained.unwrap() == 10
     
-    def test_and_then_preserves_error(self):
+    def test_and_then_preserves_error(self, not_found_error):
         """Test and_then() preserves error."""
-        error = AppError(ErrorType.NOT_FOUND_ERROR, "Not found")
-        result = Result.err(error)
+        result = Result.err(not_found_error)
         chained = result.and_then(lambda x: Result.ok(x * 2))
         assert chained.is_err()
-        assert chained.error() == error
+        assert chained.error() == not_found_error
     
     def test_from_exception_converts_exception(self):
         """Test from_exception() converts exception to Result."""
@@ -80,26 +112,21 @@ class TestResult:
         assert result.error().type == ErrorType.VALIDATION_ERROR
         assert result.error().original_error == exc
     
-    def test_equality(self):
+    @pytest.mark.parametrize("i,j,expected", [
+        (0, 1, True),
+        (0, 2, False),
+        (0, 3, False),
+    ], ids=["same_value", "different_value", "ok_vs_err"])
+    def test_equality(self, equality_results, i, j, expected):
         """Test Result equality comparison."""
-        result1 = Result.ok(42)
-        result2 = Result.ok(42)
-        result3 = Result.ok(100)
-        error = AppError(ErrorType.VALIDATION_ERROR, "Error")
-        result4 = Result.err(error)
-        
-        assert result1 == result2
-        assert result1 != result3
-        assert result1 != result4
+        assert (equality_results[i] == equality_results[j]) is expected
     
-    def test_repr(self):
+    def test_repr(self, ok42, validation_error):
         """Test Result string representation."""
-        result_ok = Result.ok(42)
-        assert "Result.ok" in repr(result_ok)
-        assert "42" in repr(result_ok)
+        assert "Result.ok" in repr(ok42)
+        assert "42" in repr(ok42)
         
-        error = AppError(ErrorType.VALIDATION_ERROR, "Error")
-        result_err = Result.err(error)
+        result_err = Result.err(validation_error)
         assert "Result.err" in repr(result_err)
 
 
@@ -132,6 +159,12 @@ class TestAppError:
         assert error_dict["message"] == "Not found"
         assert error_dict["details"] == {"well": "15/9-F-5"}
     
+    @pytest.mark.parametrize("error_type", list(ErrorType))
+    def test_error_type_value_is_serialized_name(self, error_type):
+        """Test ErrorType values are the lowercase names used verbatim by to_dict."""
+        assert error_type.value == error_type.name.lower()
+        assert AppError(error_type, "msg").to_dict()["type"] == error_type.value
+    
     def test_error_str(self):
         """Test error string representation."""
         error = AppError(
@@ -173,60 +206,26 @@ class TestAppError:
 class TestErrorSanitization:
     """Test error message sanitization."""
     
-    def test_sanitize_removes_file_paths_windows(self):
-        """Test sanitization removes Windows file paths."""
-        message = "Error in C:\\Users\\test\\file.py: Invalid operation"
+    @pytest.mark.parametrize("message,expected,forbidden", [
+        ("Error in C:\\Users\\test\\file.py: Invalid operation", "[FILE_PATH]", "C:\\Users"),
+        ("Error in /home/user/file.py: Invalid operation", "[FILE_PATH]", "/home/user"),
+        ("API key sk-1234567890abcdef is invalid", "[API_KEY]", "sk-1234567890abcdef"),
+        ("api_key=secret123 password=pass456", "[REDACTED]", "secret123"),
+        ("api_key=secret123 password=pass456", "[REDACTED]", "pass456"),
+        ("Contact admin@example.com for help", "[EMAIL]", "admin@example.com"),
+        ("Traceback (most recent call last):\n  File \"test.py\", line 1", "[STACK_TRACE]", "Traceback"),
+    ], ids=["windows_path", "unix_path", "api_key", "secret", "password", "email", "stack_trace"])
+    def test_sanitize_redacts(self, message, expected, forbidden):
+        """Test sanitization replaces sensitive content with a placeholder."""
         sanitized = sanitize_error_message(message)
-        assert "[FILE_PATH]" in sanitized
-        assert "C:\\Users" not in sanitized
-    
-    def test_sanitize_removes_file_paths_unix(self):
-        """Test sanitization removes Unix file paths."""
-        message = "Error in /home/user/file.py: Invalid operation"
-        sanitized = sanitize_error_message(message)
-        assert "[FILE_PATH]" in sanitized
-        assert "/home/user" not in sanitized
-    
-    def test_sanitize_removes_api_keys(self):
-        """Test sanitization removes API keys."""
-        message = "API key sk-1234567890abcdef is invalid"
-        sanitized = sanitize_error_message(message)
-        assert "[API_KEY]" in sanitized
-        assert "sk-1234567890abcdef" not in sanitized
-    
-    def test_sanitize_removes_secrets(self):
-        """Test sanitization removes secrets."""
-        message = "api_key=secret123 password=pass456"
-        sanitized = sanitize_error_message(message)
-        assert "[REDACTED]" in sanitized
-        assert "secret123" not in sanitized
-        assert "pass456" not in sanitized
-    
-    def test_sanitize_removes_email_addresses(self):
-        """Test sanitization removes email addresses."""
-        message = "Contact admin@example.com for help"
-        sanitized = sanitize_error_message(message)
-        assert "[EMAIL]" in sanitized
-        assert "admin@example.com" not in sanitized
-    
-    def test_sanitize_removes_stack_traces(self):
-        """Test sanitization removes stack traces."""
-        message = "Traceback (most recent call last):\n  File \"test.py\", line 1"
-        sanitized = sanitize_error_message(message)
-        assert "[STACK_TRACE]" in sanitized
-        assert "Traceback" not in sanitized
-    
-    def test_sanitize_preserves_safe_messages(self):
-        """Test sanitization preserves safe error messages."""
-        message = "Invalid input: query is too long"
-        sanitized = sanitize_error_message(message)
-        assert sanitized == message
-    
-    def test_sanitize_handles_empty_string(self):
-        """Test sanitization handles empty strings."""
-        assert sanitize_error_message("") == ""
-    
-    def test_sanitize_handles_none(self):
-        """Test sanitization handles None."""
-        assert sanitize_error_message(None) == ""
-
+        assert expected in sanitized
+        assert forbidden not in sanitized
+    
+    @pytest.mark.parametrize("message,expected", [
+        ("Invalid input: query is too long", "Invalid input: query is too long"),
+        ("", ""),
+        (None, ""),
+    ], ids=["safe_message", "empty", "none"])
+    def test_sanitize_passes_through(self, message, expected):
+        """Test sanitization leaves safe, empty and missing messages intact."""
+        assert sanitize_error_message(message) == expected
@@ -197,6 +197,17 @@ class TestSanitizeInput:
         assert result.is_ok()
         assert "15/9-F-5" in result.unwrap()
     
+    def test_fast_path_strips_plain_text(self):
+        """Test plain ASCII queries skip the pattern scan but are still stripped."""
+        result = sanitize_input("  porosity in 15/9-F-5?  ")
+        assert result.is_ok()
+        assert result.unwrap() == "porosity in 15/9-F-5?"
+    
+    def test_rejects_dangerous_pattern_with_safe_prefix(self):
+        """Test inputs outside the safe charset still go through the pattern scan."""
+        result = sanitize_input("porosity eval(1)")
+        assert result.is_err()
+    
     def test_rejects_too_long_input(self):
         """Test rejects input that exceeds max_length."""
         long_text = "x" * 3000  # Exceeds default max_length of 2000
@@ -2,7 +2,8 @@
 Unit tests for thresholds module.
 """
 import pytest
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 from src.core.thresholds import (
     MatchingThresholds,
     RetrievalThresholds,
@@ -11,35 +12,53 @@ from src.core.thresholds import (
 )
 
 
+@pytest.fixture(scope="module")
+def config_mock():
+    """
+    Config stand-in shared by the from_config tests.
+    
+    A plain namespace rather than a MagicMock: reading an attribute that is
+    not set raises AttributeError instead of silently returning a mock.
+    """
+    return SimpleNamespace(
+        formation_fuzzy_threshold=90.0,
+        formation_fuzzy_margin=15.0,
+        chunk_size=1000,
+        chunk_overlap=200,
+        mmr_lambda=0.8,
+    )
+
+
 @pytest.mark.unit
 class TestMatchingThresholds:
     """Test MatchingThresholds dataclass."""
     
-    def test_default_values(self):
-        """Test default threshold values."""
-        thresholds = MatchingThresholds()
-        assert thresholds.formation_fuzzy_threshold == 85.0
-        assert thresholds.formation_fuzzy_margin == 10.0
-        assert thresholds.well_fuzzy_threshold == 85.0
-    
-    def test_custom_values(self):
-        """Test custom threshold values."""
-        thresholds = MatchingThresholds(
-            formation_fuzzy_threshold=90.0,
-            formation_fuzzy_margin=15.0,
-            well_fuzzy_threshold=80.0
-        )
-        assert thresholds.formation_fuzzy_threshold == 90.0
-        assert thresholds.formation_fuzzy_margin == 15.0
-        assert thresholds.well_fuzzy_threshold == 80.0
+    @pytest.mark.parametrize("kwargs,expected", [
+        ({}, {
+            "formation_fuzzy_threshold": 85.0,
+            "formation_fuzzy_margin": 10.0,
+            "well_fuzzy_threshold": 85.0,
+        }),
+        ({
+            "formation_fuzzy_threshold": 90.0,
+            "formation_fuzzy_margin": 15.0,
+            "well_fuzzy_threshold": 80.0,
+        }, {
+            "formation_fuzzy_threshold": 90.0,
+            "formation_fuzzy_margin": 15.0,
+            "well_fuzzy_threshold": 80.0,
+        }),
+    ], ids=["defaults", "custom"])
+    def test_values(self, kwargs, expected):
+        """Test default and custom threshold values."""
+        thresholds = MatchingThresholds(**kwargs)
+        for name, value in expected.items():
+            assert getattr(thresholds, name) == value
     
     @patch('src.core.thresholds.get_config')
-    def test_from_config_loads_values(self, mock_get_config):
+    def test_from_config_loads_values(self, mock_get_config, config_mock):
         """Test from_config loads values from config."""
-        mock_config = MagicMock()
-        mock_config.formation_fuzzy_threshold = 90.0
-        mock_config.formation_fuzzy_margin = 15.0
-        mock_get_config.return_value = mock_config
+        mock_get_config.return_value = config_mock
         
         thresholds = MatchingThresholds.from_config()
         assert thresholds.formation_fuzzy_threshold == 90.0
@@ -63,41 +82,41 @@ class TestMatchingThresholds:
 class TestRetrievalThresholds:
     """Test RetrievalThresholds dataclass."""
     
-    def test_default_values(self):
-        """Test default threshold values."""
-        thresholds = RetrievalThresholds()
-        assert thresholds.chunk_size == 500
-        assert thresholds.chunk_overlap == 150
-        assert thresholds.mmr_lambda == 0.7
-        assert thresholds.max_query_length == 5000
-        assert thresholds.min_context_length == 50
-        assert thresholds.max_context_length == 3000
-    
-    def test_custom_values(self):
-        """Test custom threshold values."""
-        thresholds = RetrievalThresholds(
-            chunk_size=1000,
-            chunk_overlap=200,
-            mmr_lambda=0.8,
-            max_query_length=10000,
-            min_context_length=100,
-            max_context_length=5000
-        )
-        assert thresholds.chunk_size == 1000
-        assert thresholds.chunk_overlap == 200
-        assert thresholds.mmr_lambda == 0.8
-        assert thresholds.max_query_length == 10000
-        assert thresholds.min_context_length == 100
-        assert thresholds.max_context_length == 5000
+    @pytest.mark.parametrize("kwargs,expected", [
+        ({}, {
+            "chunk_size": 500,
+            "chunk_overlap": 150,
+            "mmr_lambda": 0.7,
+            "max_query_length": 5000,
+            "min_context_length": 50,
+            "max_context_length": 3000,
+        }),
+        ({
+            "chunk_size": 1000,
+            "chunk_overlap": 200,
+            "mmr_lambda": 0.8,
+            "max_query_length": 10000,
+            "min_context_length": 100,
+            "max_context_length": 5000,
+        }, {
+            "chunk_size": 1000,
+            "chunk_overlap": 200,
+            "mmr_lambda": 0.8,
+            "max_query_length": 10000,
+            "min_context_length": 100,
+            "max_context_length": 5000,
+        }),
+    ], ids=["defaults", "custom"])
+    def test_values(self, kwargs, expected):
+        """Test default and custom threshold values."""
+        thresholds = RetrievalThresholds(**kwargs)
+        for name, value in expected.items():
+            assert getattr(thresholds, name) == value
     
     @patch('src.core.thresholds.get_config')
-    def test_from_config_loads_values(self, mock_get_config):
+    def test_from_config_loads_values(self, mock_get_config, config_mock):
         """Test from_config loads values from config."""
-        mock_config = MagicMock()
-        mock_config.chunk_size = 1000
-        mock_config.chunk_overlap = 200
-        mock_config.mmr_lambda = 0.8
-        mock_get_config.return_value = mock_config
+        mock_get_config.return_value = config_mock
         
         thresholds = RetrievalThresholds.from_config()
         assert thresholds.chunk_size == 1000
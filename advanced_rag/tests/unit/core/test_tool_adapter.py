@@ -17,6 +17,11 @@ class TestResultToString:
         output = result_to_string(result)
         assert output == "success_value"
     
+    def test_converts_non_string_ok_value(self):
+        """Test non-string success values are returned as strings."""
+        output = result_to_string(Result.ok(42))
+        assert output == "42"
+    
     def test_returns_json_error_for_error_result(self):
         """Test returns JSON error for error Result."""
         result = Result.err(AppError(
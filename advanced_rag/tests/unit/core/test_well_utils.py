@@ -68,6 +68,11 @@ class TestNormalizeWell:
         """Test handles whitespace."""
         assert normalize_well(" 15/9-F-5 ") == "159F5"
 
+    def test_removes_non_ascii_characters(self):
+        """Test drops non-ASCII characters, matching the ASCII path."""
+        assert normalize_well("15/9-F-5 Ø") == "159F5"
+        assert normalize_well("ß15/9") == "SS159"
+
 
 @pytest.mark.unit
 class TestCanonicalizeWell:
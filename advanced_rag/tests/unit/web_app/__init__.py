@@ -0,0 +1,3 @@
+"""
+Unit tests for web_app module.
+"""
@@ -0,0 +1,125 @@
+"""
+Unit tests for citation_parser module.
+"""
+import dataclasses
+import time
+
+import pytest
+from web_app.logic.citation_parser import Citation, _parse_citations
+
+
+@pytest.mark.unit
+class TestParseCitations:
+    """Test _parse_citations function."""
+
+    def test_parses_page_range(self):
+        """Test parses a 'pages X-Y' citation."""
+        cits = _parse_citations("Answer.\nSource: 15_9-F-5/REPORT.PDF (pages 3-4)")
+        assert cits == [Citation("15_9-F-5/REPORT.PDF", 3, 4)]
+
+    def test_parses_single_page(self):
+        """Test single page sets start and end to the same page."""
+        cits = _parse_citations("Source: 15_9-F-5/REPORT.PDF (page 7)")
+        assert cits == [Citation("15_9-F-5/REPORT.PDF", 7, 7)]
+
+    def test_parses_bare_source(self):
+        """Test source without page info has no pages."""
+        cits = _parse_citations("Source: 15_9-F-5/REPORT.PDF")
+        assert cits == [Citation("15_9-F-5/REPORT.PDF")]
+
+    def test_normalizes_windows_relative_path(self):
+        """Test backslashes and leading '..' are normalized."""
+        cits = _parse_citations(
+            "Source: ..\\spwla_volve-main\\15_9-F-5\\PETROPHYSICAL_REPORT_1.PDF (pages 3-4)"
+        )
+        assert cits == [Citation("spwla_volve-main/15_9-F-5/PETROPHYSICAL_REPORT_1.PDF", 3, 4)]
+
+    def test_handles_indentation_and_spacing(self):
+        """Test tolerates leading indentation and spaces inside the page group."""
+        cits = _parse_citations("  Source:   a.pdf   (pages 12 - 13)  ")
+        assert cits == [Citation("a.pdf", 12, 13)]
+
+    def test_skips_na_source(self):
+        """Test 'N/A' sources are not reported."""
+        assert _parse_citations("Source: N/A") == []
+
+    def test_skips_unparsed_page_info(self):
+        """Test bare source that looks like it has page info is skipped."""
+        assert _parse_citations("Source: a.pdf (page x)") == []
+
+    def test_deduplicates_citations(self):
+        """Test repeated citations are reported once, in first-seen order."""
+        answer = "\n".join([
+            "Source: a.pdf (page 1)",
+            "Source: b.pdf",
+            "Source: a.pdf (page 1)",
+            "Source: b.pdf",
+            "Source: a.pdf (pages 1-2)",
+        ])
+        assert _parse_citations(answer) == [
+            Citation("a.pdf", 1, 1),
+            Citation("b.pdf"),
+            Citation("a.pdf", 1, 2),
+        ]
+
+    def test_ignores_source_not_at_line_start(self):
+        """Test 'Source:' in the middle of a line is not a citation."""
+        assert _parse_citations("See Source: a.pdf (page 1)") == []
+
+    @pytest.mark.parametrize("answer", [None, 5, "", "   ", "no citations here"])
+    def test_returns_empty_without_citations(self, answer):
+        """Test non-string, blank and citation-free answers return []."""
+        assert _parse_citations(answer) == []
+
+    def test_source_label_does_not_span_lines(self):
+        """Test a 'Source:' label with the path on the next line is not a citation."""
+        assert _parse_citations("Source:\n15_9-F-5/x.pdf (pages 1-2)") == []
+        assert _parse_citations("Source:  \n  x.pdf (page 3)") == []
+
+    @pytest.mark.parametrize("newline", ["\r", "\r\n"], ids=["cr", "crlf"])
+    def test_handles_cr_line_endings(self, newline):
+        """Test CR and CRLF line endings separate Source lines."""
+        answer = newline.join([
+            "Source: a.pdf (page 1)",
+            "Source: b.pdf (page 2)",
+            "Source: c.pdf",
+            "",
+        ])
+        assert _parse_citations(answer) == [
+            Citation("a.pdf", 1, 1),
+            Citation("b.pdf", 2, 2),
+            Citation("c.pdf"),
+        ]
+
+    @pytest.mark.parametrize("answer,expected", [
+        ("Source: a" + " " * 20_000 + "b.pdf", [Citation("a" + " " * 20_000 + "b.pdf")]),
+        ("Source: a" + "\u00a0" * 20_000 + "b.pdf", [Citation("a" + "\u00a0" * 20_000 + "b.pdf")]),
+        ("Source: a.pdf" + "\u00a0" * 20_000 + "(page 3)", [Citation("a.pdf", 3, 3)]),
+        ("Source: a.pdf" + " " * 20_000 + "(page x)", []),
+    ], ids=["inner_spaces", "inner_nbsp", "nbsp_before_page", "spaces_before_bad_page"])
+    def test_long_whitespace_runs_parse_in_linear_time(self, answer, expected):
+        """Test long whitespace runs don't trigger quadratic regex backtracking."""
+        start = time.perf_counter()
+        cits = _parse_citations(answer)
+        elapsed = time.perf_counter() - start
+
+        assert cits == expected
+        # A linear scan takes about a millisecond here; backtracking took seconds
+        assert elapsed < 1.0, f"Parsing took {elapsed:.2f}s"
+
+    def test_returns_fresh_list_per_call(self):
+        """Test mutating a returned list doesn't leak into the cached parse."""
+        answer = "Source: a.pdf (page 1)\nSource: b.pdf (pages 2-3)"
+        first = _parse_citations(answer)
+        first.append(Citation("injected.pdf"))
+        first.pop(0)
+
+        assert _parse_citations(answer) == [Citation("a.pdf", 1, 1), Citation("b.pdf", 2, 3)]
+
+    def test_citations_are_frozen(self):
+        """Test cached Citation objects can't be modified in place."""
+        cit = _parse_citations("Source: a.pdf (page 1)")[0]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            cit.page_start = 99
+
+        assert _parse_citations("Source: a.pdf (page 1)") == [Citation("a.pdf", 1, 1)]
@@ -12,23 +12,35 @@ To run the app:
 
 from __future__ import annotations
 
-# Import main function and all public functions from new modular structure
-from web_app.app import main
-from web_app.logic.citation_parser import Citation, _parse_citations, _clean_source_path
-from web_app.logic.asset_downloader import (
-    _download_and_extract_pdfs,
-    _download_and_extract_vectorstore,
-    _ensure_pdfs_available,
-    _ensure_vectorstore_available
-)
-from web_app.logic.pdf_viewer import (
-    _find_pdf_file,
-    _pdf_full_viewer,
-    _get_pdf_data_uri,
-    _pdf_iframe,
-    _render_pdf_page_png
-)
-from web_app.logic.graph_manager import _get_graph
+import importlib
+
+# Re-exports are resolved lazily (PEP 562) so importing one symbol does not
+# pull in Streamlit, the PDF tooling and the LangGraph stack all at once.
+_LAZY_EXPORTS = {
+    "main": "web_app.app",
+    "Citation": "web_app.logic.citation_parser",
+    "_parse_citations": "web_app.logic.citation_parser",
+    "_clean_source_path": "web_app.logic.citation_parser",
+    "_download_and_extract_pdfs": "web_app.logic.asset_downloader",
+    "_download_and_extract_vectorstore": "web_app.logic.asset_downloader",
+    "_ensure_pdfs_available": "web_app.logic.asset_downloader",
+    "_ensure_vectorstore_available": "web_app.logic.asset_downloader",
+    "_find_pdf_file": "web_app.logic.pdf_viewer",
+    "_pdf_full_viewer": "web_app.logic.pdf_viewer",
+    "_get_pdf_data_uri": "web_app.logic.pdf_viewer",
+    "_pdf_iframe": "web_app.logic.pdf_viewer",
+    "_render_pdf_page_png": "web_app.logic.pdf_viewer",
+    "_get_graph": "web_app.logic.graph_manager",
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return getattr(importlib.import_module(module_name), name)
+
 
 # Re-export for backward compatibility
 __all__ = [
@@ -48,19 +60,21 @@ __all__ = [
     "_get_graph",
 ]
 
-# Streamlit executes files directly, so call main() at module level
-# This ensures the app runs when Streamlit executes this file via `streamlit run web_app.py`
-# Note: This file is meant to be executed by Streamlit, not imported as a module
-try:
-    main()
-except Exception as e:
-    # If main() fails, try to show error in Streamlit
+# `streamlit run web_app.py` executes this file as __main__, so the guard keeps
+# the app starting there while plain imports (e.g. from tests) stay side-effect free.
+if __name__ == "__main__":
+    from web_app.app import main
+
     try:
-        import streamlit as st
-        st.error(f"Application failed to start: {e}")
-        st.exception(e)
-    except:
-        # If Streamlit isn't available, just raise the error
-        import traceback
-        traceback.print_exc()
-        raise
+        main()
+    except Exception as e:
+        # If main() fails, try to show error in Streamlit
+        try:
+            import streamlit as st
+            st.error(f"Application failed to start: {e}")
+            st.exception(e)
+        except:
+            # If Streamlit isn't available, just raise the error
+            import traceback
+            traceback.print_exc()
+            raise
@@ -2,14 +2,38 @@
 Citation parsing logic for extracting source references from answers.
 """
 import re
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 __all__ = ["Citation", "_parse_citations", "_clean_source_path", "_normalize_source_path"]
 
+# Compiled once at import; _parse_citations runs on every chat turn.
+# _RE_SOURCE finds every Source line in one MULTILINE scan: "pages X-Y" fills
+# ps/pe, "page X" fills p, and neither is set for a bare path. src keeps its
+# leading whitespace (callers strip it) so the lazy match starts at the colon.
+# _HWS is \s without the newline, so a match never spills into the next line.
+# src is one character or ends on a non-space: the shortest match always has
+# that shape, and it stops src from ending at every position inside a run of
+# spaces, each of which the trailing _HWS* would rescan (quadratic time).
+_HWS = r"[^\S\n]"
+_RE_SOURCE = re.compile(
+    rf"^{_HWS}*Source:(?P<src>.(?:.*?\S)??)"
+    rf"(?:{_HWS}*\((?:pages{_HWS}+(?P<ps>\d+){_HWS}*-{_HWS}*(?P<pe>\d+)|page{_HWS}+(?P<p>\d+))\))?"
+    rf"{_HWS}*$",
+    re.MULTILINE,
+)
+_RE_WELL_DIR = re.compile(r'^\d+[\s_/-]*\d+')
 
-@dataclass
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a __dict__.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Frozen: instances are shared through the _parse_citations cache
+@dataclass(frozen=True, **_SLOTS)
 class Citation:
     """Represents a citation with source path and page range."""
     source_path: str
@@ -17,6 +41,8 @@ class Citation:
     page_end: Optional[int] = None
 
 
+# Chats cite the same few PDFs repeatedly, and both path helpers are pure.
+@lru_cache(maxsize=1024)
 def _clean_source_path(source_path: str) -> str:
     """
     Clean up source path to show a user-friendly filename or relative path.
@@ -33,6 +59,18 @@ def _clean_source_path(source_path: str) -> str:
     
     # Handle Windows paths and relative paths
     path_str = source_path.replace('\\', '/')
+
+    # Fast path: the usual ".../<well_dir>/<file>.pdf" shape only needs the
+    # last two components, which the full filter below would keep anyway.
+    tail = path_str.rstrip('/').rsplit('/', 2)[-2:]
+    if (
+        len(tail) == 2
+        and tail[1].lower().endswith('.pdf')
+        and not tail[0].endswith(':')
+        and _RE_WELL_DIR.match(tail[0])
+    ):
+        return '/'.join(tail)
+
     parts = [p for p in path_str.split('/') if p and p != '..' and p != '.']
     
     # Remove common prefixes like "C:", "Users", "Downloads", "spwla_volve-main"
@@ -46,7 +84,7 @@ def _clean_source_path(source_path: str) -> str:
         if part.endswith(':') or part.lower() in ['users', 'downloads', 'spwla_volve-main']:
             continue
         # Keep well directories and filenames
-        if re.match(r'^\d+[\s_/-]*\d+', part) or part.lower().endswith('.pdf'):
+        if _RE_WELL_DIR.match(part) or part.lower().endswith('.pdf'):
             filtered_parts.append(part)
     
     # If we have well directory and filename, return "well_dir/filename"
@@ -60,6 +98,7 @@ def _clean_source_path(source_path: str) -> str:
         return Path(source_path).name
 
 
+@lru_cache(maxsize=1024)
 def _normalize_source_path(source_path: str) -> str:
     """
     Normalize source path for consistent handling.
@@ -74,16 +113,28 @@ def _normalize_source_path(source_path: str) -> str:
     if not source_path:
         return source_path
     
+    # Fast path: already forward-slashed with no empty, '.' or '..' segments
+    # (anything starting with '.' is treated as one), so nothing would change.
+    if (
+        '\\' not in source_path
+        and '/.' not in source_path
+        and '//' not in source_path
+        and not source_path.startswith(('.', '/'))
+        and not source_path.endswith('/')
+    ):
+        return source_path
+    
     # Convert backslashes to forward slashes for consistency
     normalized = source_path.replace('\\', '/')
     
     # Handle relative paths (remove leading .. or .)
     parts = [p for p in normalized.split('/') if p and p != '.']
-    # Remove leading '..' parts but keep the rest
-    while parts and parts[0] == '..':
-        parts.pop(0)
+    # Skip leading '..' parts but keep the rest (index scan, no repeated pop(0))
+    start = 0
+    while start < len(parts) and parts[start] == '..':
+        start += 1
     
-    return '/'.join(parts) if parts else normalized
+    return '/'.join(parts[start:]) if start < len(parts) else normalized
 
 
 def _parse_citations(answer: str) -> List[Citation]:
@@ -97,87 +148,53 @@ def _parse_citations(answer: str) -> List[Citation]:
     """
     if not isinstance(answer, str) or not answer.strip():
         return []
+    # Most answers carry no citations; skip the regex scan entirely.
+    if 'Source:' not in answer:
+        return []
+
+    # Copy so callers can't mutate the cached sequence
+    return list(_parse_citations_cached(answer))
+
 
+# Streamlit re-runs the whole script on every interaction, re-parsing the
+# same chat history each time; cache the parse per answer string.
+@lru_cache(maxsize=64)
+def _parse_citations_cached(answer: str) -> Tuple[Citation, ...]:
+    """Parse citations from an answer known to contain 'Source:'."""
     cits: List[Citation] = []
     seen = set()  # Avoid duplicates
 
-    # Normalize line endings and split into lines for more robust parsing
-    lines = answer.split('\n')
-    
-    # Pattern 1: Source: path (pages X-Y) - most common format
-    # Match on individual lines for better reliability
-    for line in lines:
-        line = line.strip()
-        if not line.startswith('Source:'):
-            continue
-            
-        # Pattern 1a: Source: path (pages X-Y)
-        match = re.match(
-            r"^Source:\s*(.+?)\s*\(pages\s+(\d+)\s*-\s*(\d+)\)\s*$",
-            line,
-        )
-        if match:
-            source = _normalize_source_path(match.group(1).strip())
-            page_start = int(match.group(2))
-            page_end = int(match.group(3))
-            key = (source, page_start, page_end)
-            if key not in seen:
-                seen.add(key)
-                cits.append(Citation(source, page_start, page_end))
-                continue
-        
-        # Pattern 1b: Source: path (page X)
-        match = re.match(
-            r"^Source:\s*(.+?)\s*\(page\s+(\d+)\)\s*$",
-            line,
-        )
-        if match:
-            source = _normalize_source_path(match.group(1).strip())
-            page = int(match.group(2))
-            key = (source, page, page)
-            if key not in seen:
-                seen.add(key)
-                cits.append(Citation(source, page, page))
-                continue
-        
-        # Pattern 1c: Source: path (no page info) - fallback
-        match = re.match(r"^Source:\s*(.+?)\s*$", line)
-        if match:
-            source = _normalize_source_path(match.group(1).strip())
-            # Skip if it looks like it has page info but didn't match (avoid duplicates)
-            if "(page" not in source and "(pages" not in source and source != "N/A":
+    # MULTILINE anchors only break on '\n'; CRLF is absorbed by the trailing
+    # whitespace, but a lone '\r' line ending needs converting first.
+    if '\r' in answer:
+        answer = answer.replace('\r\n', '\n').replace('\r', '\n')
+
+    # One scan over the whole answer; lines without a Source prefix are
+    # skipped inside the regex engine.
+    for match in _RE_SOURCE.finditer(answer):
+        # Interned so repeat citations compare by identity in the seen set
+        source = sys.intern(_normalize_source_path(match.group('src').strip()))
+
+        if match.group('ps') is not None:
+            # Pattern 1a: Source: path (pages X-Y)
+            page_start = int(match.group('ps'))
+            page_end = int(match.group('pe'))
+        elif match.group('p') is not None:
+            # Pattern 1b: Source: path (page X)
+            page_start = page_end = int(match.group('p'))
+        else:
+            # Pattern 1c: Source: path (no page info) - fallback
+            # Skip blank sources (a "Source:" line with nothing after it) and
+            # ones that look like they have page info but didn't match
+            if source and "(page" not in source and "(pages" not in source and source != "N/A":
                 if source not in seen:
                     seen.add(source)
                     cits.append(Citation(source))
-    
-    # Also try multiline regex as fallback (for edge cases)
-    if not cits:
-        # Pattern 2: Source: path (pages X-Y) - multiline regex
-        for m in re.finditer(
-            r"^Source:\s*(.+?)\s*\(pages\s+(\d+)\s*-\s*(\d+)\)\s*$",
-            answer,
-            flags=re.MULTILINE,
-        ):
-            source = _normalize_source_path(m.group(1).strip())
-            page_start = int(m.group(2))
-            page_end = int(m.group(3))
-            key = (source, page_start, page_end)
-            if key not in seen:
-                seen.add(key)
-                cits.append(Citation(source, page_start, page_end))
-
-        # Pattern 3: Source: path (page X) - multiline regex
-        for m in re.finditer(
-            r"^Source:\s*(.+?)\s*\(page\s+(\d+)\)\s*$",
-            answer,
-            flags=re.MULTILINE,
-        ):
-            source = _normalize_source_path(m.group(1).strip())
-            page = int(m.group(2))
-            key = (source, page, page)
-            if key not in seen:
-                seen.add(key)
-                cits.append(Citation(source, page, page))
-
-    return cits
+            continue
 
+        key = (source, page_start, page_end)
+        if key not in seen:
+            seen.add(key)
+            cits.append(Citation(source, page_start, page_end))
+    
+    return tuple(cits)